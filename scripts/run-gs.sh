@@ -22,9 +22,6 @@ BROWSER=none npm run start --prefix "$SCRIPT_DIR"/../client | cat &
 
 # Run server
 cd "$SCRIPT_DIR"/../server || exit
-export FLASK_APP="$SCRIPT_DIR"/../server/app.py
-export FLASK_ENV=development
 export FLASK_DEBUG=0
-"$SCRIPT_DIR"/../server/venv/bin/python -m flask run --host=0.0.0.0
-
-wait
+# Run app.py directly so "production": true in config.json starts Waitress
+exec "$SCRIPT_DIR"/../server/venv/bin/python app.py
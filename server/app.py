@@ -1,128 +1,123 @@
-import json
+import functools
+import itertools
+import linecache
 import logging
 import os.path
 import traceback
+from types import TracebackType
+from typing import Any, Callable, Mapping
 
 from flask import Flask, jsonify, send_file, Response
+from flask_compress import Compress
 from flask_cors import CORS
 
 from apps import uav, image
 from groundstation import GroundStation
+from utils.config import load_config
 from utils.errors import (
     InvalidRequestError,
     InvalidStateError,
     GeneralError,
     ServiceUnavailableError,
 )
-from utils.logging_setup import ROLLING_LOGS
+from utils.json_provider import ORJSONProvider
+from utils.logging_setup import ROLLING_LOGS, configure_logging
 import sys
 
 sys.stdin.reconfigure(encoding="utf-8")
 sys.stdout.reconfigure(encoding="utf-8")  # These two lines account for Krishnan's massive brain
 
+# Werkzeug logs every request at INFO, which is too much for telemetry polling
 log: logging.Logger = logging.getLogger("werkzeug")
 log.setLevel(logging.ERROR)
 
-with open(os.path.join(os.getcwd(), "config.json"), "r", encoding="utf-8") as file:
-    config: dict = json.load(file)
+config: Mapping[str, Any] = load_config()
+
+configure_logging(config)
 
 app: Flask = Flask(__name__)
-app.config["JSONIFY_PRETTYPRINT_REGULAR"] = True
-CORS(app)
+app.json = ORJSONProvider(app)
+CORS(app, max_age=86400)  # Let browsers cache preflight responses for a day
+
+# Gzip larger JSON responses (params, mission waypoints); level 5 keeps CPU cost low
+app.config["COMPRESS_ALGORITHM"] = "gzip"
+app.config["COMPRESS_LEVEL"] = 5
+app.config["COMPRESS_MIN_SIZE"] = 1024
+Compress(app)
 
 app.register_blueprint(uav, url_prefix="/uav")
 app.register_blueprint(image, url_prefix="/image")
 
 logger: logging.Logger = logging.getLogger("groundstation")
 
+DEBUG: bool = config.get("debug", False)
+DEBUG_LOG: bool = config.get("debug_log", False)
+PRODUCTION: bool = config.get("production", False)
+
+LOGS_DIR: str = os.path.join(os.getcwd(), "logs")
+INFO_LOG_FILE: str = os.path.join(LOGS_DIR, "info.log")
+DEBUG_LOG_FILE: str = os.path.join(LOGS_DIR, "debug.log")
+TELEM_LOG_FILE: str = os.path.join(LOGS_DIR, "telem.log")
+
+TRACEBACK_LIMIT: int = 10  # Frames included in error responses when debugging
+
 gs: GroundStation = GroundStation(config=config)
 app.gs = gs
 app.gs_config = config
 
 
-@app.errorhandler(Exception)
-def handle_error(e: Exception) -> tuple[Response, int]:
-    logger.error(type(e).__name__)
-    logger.info("Traceback of %s : ", type(e).__name__, exc_info=e)
-    return (
-        jsonify(
-            {
-                "title": "Unhandled Server Error",
-                "message": str(e),
-                "exception": type(e).__name__,
-                "traceback": traceback.format_tb(e.__traceback__),
-            }
-        ),
-        500,
-    )
-
-
-@app.errorhandler(InvalidRequestError)
-def handle_400(e: InvalidRequestError) -> tuple[Response, int]:
-    logger.error(type(e).__name__)
-    logger.info("Traceback of %s : ", type(e).__name__, exc_info=e)
-    return (
-        jsonify(
-            {
-                "title": "Invalid Request",
-                "message": str(e),
-                "exception": type(e).__name__,
-                "traceback": traceback.format_tb(e.__traceback__),
-            }
-        ),
-        400,
-    )
-
-
-@app.errorhandler(InvalidStateError)
-def handle_409(e: InvalidStateError) -> tuple[Response, int]:
-    logger.error(type(e).__name__)
-    logger.info("Traceback of %s : ", type(e).__name__, exc_info=e)
-    return (
-        jsonify(
-            {
-                "title": "Invalid State Error",
-                "message": str(e),
-                "exception": type(e).__name__,
-                "traceback": traceback.format_tb(e.__traceback__),
-            }
-        ),
-        409,
-    )
-
-
-@app.errorhandler(GeneralError)
-def handle_500(e: GeneralError) -> tuple[Response, int]:
-    logger.error(type(e).__name__)
-    logger.info("Traceback of %s : ", type(e).__name__, exc_info=e)
-    return (
-        jsonify(
-            {
-                "title": "Server Error",
-                "message": str(e),
-                "exception": type(e).__name__,
-                "traceback": traceback.format_tb(e.__traceback__),
-            }
-        ),
-        500,
-    )
-
-
-@app.errorhandler(ServiceUnavailableError)
-def handle_503(e: ServiceUnavailableError) -> tuple[Response, int]:
-    logger.error(type(e).__name__)
-    logger.info("Traceback of %s : ", type(e).__name__, exc_info=e)
-    return (
-        jsonify(
-            {
-                "title": "Service Unavailable Error",
-                "message": str(e),
-                "exception": type(e).__name__,
-                "traceback": traceback.format_tb(e.__traceback__),
-            }
-        ),
-        503,
-    )
+@functools.lru_cache(maxsize=256)
+def _source_line(filename: str, lineno: int) -> str:
+    return linecache.getline(filename, lineno).strip()
+
+
+def _format_tb(tb: TracebackType | None) -> list[str]:
+    # Like traceback.format_tb, but without re-checking source files on every call
+    frames = []
+    for frame, lineno in itertools.islice(traceback.walk_tb(tb), TRACEBACK_LIMIT):
+        filename, name = frame.f_code.co_filename, frame.f_code.co_name
+        entry = f'  File "{filename}", line {lineno}, in {name}\n'
+        line = _source_line(filename, lineno)
+        if line:
+            entry += f"    {line}\n"
+        frames.append(entry)
+    return frames
+
+
+def _make_error_handler(title: str, status: int) -> Callable[[Exception], tuple[Response, int]]:
+    def handle_error(e: Exception) -> tuple[Response, int]:
+        name = type(e).__name__
+        logger.error(name)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Traceback of %s : ", name, exc_info=e)
+        return (
+            jsonify(
+                title=title,
+                message=str(e),
+                exception=name,
+                traceback=_format_tb(e.__traceback__) if DEBUG else [],
+            ),
+            status,
+        )
+
+    return handle_error
+
+
+ERROR_HANDLERS: tuple[tuple[type[Exception], str, int], ...] = (
+    (Exception, "Unhandled Server Error", 500),
+    (InvalidRequestError, "Invalid Request", 400),
+    (InvalidStateError, "Invalid State Error", 409),
+    (GeneralError, "Server Error", 500),
+    (ServiceUnavailableError, "Service Unavailable Error", 503),
+)
+
+
+def _register_error_handlers() -> None:
+    for exception, title, status in ERROR_HANDLERS:
+        app.register_error_handler(exception, _make_error_handler(title, status))
+
+
+_register_error_handlers()
 
 
 @app.route("/")
@@ -130,7 +125,6 @@ def index() -> str:
     return "TJ UAV Ground Station Backend homepage"
 
 
-@app.route("/log/<string:type_>")
 def create_log(type_: str) -> str:
     if type_ == "debug":
         logger.debug("This is for debugging")
@@ -149,6 +143,11 @@ def create_log(type_: str) -> str:
     return ""
 
 
+# Test route for the logging setup, not needed in production
+if not PRODUCTION:
+    app.add_url_rule("/log/<string:type_>", view_func=create_log)
+
+
 @app.route("/favicon.ico")
 def favicon() -> str:
     return ""
@@ -161,18 +160,27 @@ def rollinglogs():
 
 @app.route("/file/infolog")
 def logfile() -> Response:
-    return send_file(os.path.join(os.getcwd(), "logs", "info.log"))
+    return send_file(INFO_LOG_FILE)
 
 
 @app.route("/file/debuglog")
 def debuglogfile() -> Response:
-    return send_file(os.path.join(os.getcwd(), "logs", "debug.log"))
+    # The client's log viewer links here, so fall back to info.log when debug.log isn't written
+    return send_file(DEBUG_LOG_FILE if DEBUG_LOG else INFO_LOG_FILE)
 
 
 @app.route("/file/telemlog")
 def telemlogfile() -> Response:
-    return send_file(os.path.join(os.getcwd(), "logs", "telem.log"))
+    return send_file(TELEM_LOG_FILE)
 
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000)
+    if PRODUCTION:
+        # Single process only, since the GroundStation owns the UAV connection. Requests share a
+        # fixed pool of 8 threads, so slow UAV/image calls can delay polling once it's exhausted
+        from waitress import serve
+
+        serve(app, host="0.0.0.0", port=5000, threads=8)
+    else:
+        # Each request gets its own thread, so blocking UAV/image calls don't hold up polling
+        app.run(host="0.0.0.0", port=5000, threaded=True)
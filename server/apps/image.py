@@ -7,6 +7,8 @@ from utils.errors import InvalidRequestError
 
 image = Blueprint("image", __name__)
 
+ODLC_DIR: str = os.path.join(os.getcwd(), "assets", "images", "odlc")
+
 
 @image.route("/status")
 def status():
@@ -42,11 +44,10 @@ def set_config():
 
 @image.route("/image_file/<int:image_id>")
 def image_file(image_id):
-    if not os.path.exists(
-        os.path.join(os.getcwd(), "assets", "images", "odlc", f"{image_id}.png")
-    ):
+    image_path = os.path.join(ODLC_DIR, f"{image_id}.png")
+    if not os.path.exists(image_path):
         raise InvalidRequestError("Image not found")
-    return send_file(os.path.join(os.getcwd(), "assets", "images", "odlc", f"{image_id}.png"))
+    return send_file(image_path)
 
 
 @image.route("/image_data/<int:image_id>")
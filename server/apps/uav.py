@@ -6,6 +6,15 @@ from utils.errors import InvalidRequestError
 
 uav = Blueprint("uav", __name__)
 
+MISSION_FILE: str = os.path.join(os.getcwd(), "assets", "missions", "plane.txt")
+
+# Required JSON fields for each POST route
+INSERT_COMMAND_FIELDS: frozenset = frozenset(("command", "lat", "lon", "alt"))
+JUMP_COMMAND_FIELDS: frozenset = frozenset(("command",))
+GENERATE_COMMANDS_FIELDS: frozenset = frozenset(("waypoints",))
+SET_MODE_FIELDS: frozenset = frozenset(("mode",))
+SET_PARAMS_FIELDS: frozenset = frozenset(("params",))
+
 
 @uav.route("/connect", methods=["POST"])
 def uav_connect():
@@ -85,7 +94,7 @@ def uav_get_commands():
 @uav_commands.route("/insert", methods=["POST"])
 def uav_insert_command():
     f = request.json
-    if not all(field in f for field in ["command", "lat", "lon", "alt"]):
+    if not INSERT_COMMAND_FIELDS.issubset(f):
         raise InvalidRequestError("Missing required fields in request")
     return app.gs.uav.insert_command(f.get("command"), f.get("lat"), f.get("lon"), f.get("alt"))
 
@@ -93,7 +102,7 @@ def uav_insert_command():
 @uav_commands.route("/jump", methods=["POST"])
 def uav_jump_command():
     f = request.json
-    if not all(field in f for field in ["command"]):
+    if not JUMP_COMMAND_FIELDS.issubset(f):
         raise InvalidRequestError("Missing required fields in request")
     return app.gs.uav.jump_to_command(f.get("command"))
 
@@ -117,7 +126,7 @@ def uav_load_commands():
 @uav_commands.route("/view")
 def uav_view_commands_file():
     try:
-        return send_file(os.path.join(os.getcwd(), "assets", "missions", "plane.txt"))
+        return send_file(MISSION_FILE)
     except FileNotFoundError:
         return {"result": "File not found"}
 
@@ -127,9 +136,7 @@ def uav_export_commands_file():
     waypoints = []
 
     try:
-        with open(
-            os.path.join(os.getcwd(), "assets", "missions", "plane.txt"), "r", encoding="utf-8"
-        ) as f:
+        with open(MISSION_FILE, "r", encoding="utf-8") as f:
             for line in f.readlines()[1:]:
                 spl = line.split("\t")
                 waypoints.append(
@@ -153,11 +160,9 @@ def uav_export_commands_file():
 @uav_commands.route("/generate", methods=["POST"])
 def uav_generate_commands_file():
     f = request.json
-    if not all(field in f for field in ["waypoints"]):
+    if not GENERATE_COMMANDS_FIELDS.issubset(f):
         raise InvalidRequestError("Missing required fields in request")
-    with open(
-        os.path.join(os.getcwd(), "assets", "missions", "plane.txt"), "w", encoding="utf-8"
-    ) as file:
+    with open(MISSION_FILE, "w", encoding="utf-8") as file:
         file.write("QGC WPL 110\n")
         counter = 1
         for waypoint in f.get("waypoints"):
@@ -195,7 +200,7 @@ def uav_get_mode():
 @uav_mode.route("/set", methods=["POST"])
 def uav_set_mode():
     f = request.json
-    if not all(field in f for field in ["mode"]):
+    if not SET_MODE_FIELDS.issubset(f):
         raise InvalidRequestError("Missing required fields in request")
     return app.gs.uav.set_flight_mode(f.get("mode"))
 
@@ -223,7 +228,7 @@ def uav_set_param(key, value):
 @uav_params.route("/setmultiple", methods=["POST"])
 def uav_set_params():
     f = request.json
-    if not all(field in f for field in ["params"]):
+    if not SET_PARAMS_FIELDS.issubset(f):
         raise InvalidRequestError("Missing required fields in request")
     return app.gs.uav.set_params(**f.get("params"))  # {"param": "newvalue"}
 
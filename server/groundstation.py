@@ -1,23 +1,21 @@
-import json
 import logging
-import os
 import time
 from threading import Thread
+from typing import Any, Mapping
 
+import orjson
 import requests  # type: ignore[import]
 
 from handlers import UAVHandler, DummyUAVHandler, ImageHandler
+from utils.config import load_config
 
 
 class GroundStation:
-    def __init__(self, config: dict = None):
+    def __init__(self, config: Mapping[str, Any] | None = None):
         self.logger: logging.Logger = logging.getLogger("groundstation")
         self.telem_logger: logging.Logger = logging.getLogger("telemetry")
 
-        self.config: dict | None = config
-        if not self.config:
-            with open(os.path.join(os.getcwd(), "config.json"), "r", encoding="utf-8") as file:
-                self.config = json.load(file)
+        self.config: Mapping[str, Any] = config or load_config()
 
         print("╔══ CREATING HANDLERS")
         self.logger.info("CREATING HANDLERS")
@@ -49,12 +47,12 @@ class GroundStation:
         while True:
             self.uav.update()
             self.logger.debug("[UAV] Updated")
-            if self.config["uav"]["telemetry"]["log"]:  # type: ignore[index]
-                self.telem_logger.info(json.dumps(self.uav.stats()))
+            if self.config["uav"]["telemetry"]["log"]:
+                self.telem_logger.info(orjson.dumps(self.uav.stats()).decode("utf-8"))
             time.sleep(0.1)
 
     def image_thread(self) -> None:
-        if self.config["uav"]["images"]["type"] == "prod":  # type: ignore[index]
+        if self.config["uav"]["images"]["type"] == "prod":
             while True:
                 time.sleep(1)
                 img_cnt = self.image.get_img_count()
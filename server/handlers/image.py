@@ -21,6 +21,9 @@ CONNECTION_EXCEPTIONS = (
     requests.exceptions.RequestException,
 )
 
+# Seconds to wait on the image server, so an unreachable camera can't tie up request threads
+REQUEST_TIMEOUT: float = 5
+
 
 @decorate_all_functions(log, logging.getLogger("groundstation"))
 class ImageHandler:
@@ -47,7 +50,9 @@ class ImageHandler:
 
     def status(self):
         try:
-            res: requests.Response = requests.get(self.url + "/status")  # type: ignore[index]
+            res: requests.Response = requests.get(
+                self.url + "/status", timeout=REQUEST_TIMEOUT
+            )  # type: ignore[index]
             if res.status_code == 200:
                 self.on_connect()
                 return {"result": res.json()["result"]}
@@ -64,7 +69,9 @@ class ImageHandler:
 
     def pause(self):
         try:
-            res: requests.Response = requests.post(f"{self.url}/pause")  # type: ignore[index]
+            res: requests.Response = requests.post(
+                f"{self.url}/pause", timeout=REQUEST_TIMEOUT
+            )  # type: ignore[index]
             if res.status_code == 200:
                 self.on_connect()
                 return {}
@@ -81,7 +88,9 @@ class ImageHandler:
 
     def resume(self):
         try:
-            res: requests.Response = requests.post(f"{self.url}/resume")  # type: ignore[index]
+            res: requests.Response = requests.post(
+                f"{self.url}/resume", timeout=REQUEST_TIMEOUT
+            )  # type: ignore[index]
             if res.status_code == 200:
                 self.on_connect()
                 return {}
@@ -119,7 +128,9 @@ class ImageHandler:
 
     def get_config(self):
         try:
-            res: requests.Response = requests.get(f"{self.url}/config")  # type: ignore[index]
+            res: requests.Response = requests.get(
+                f"{self.url}/config", timeout=REQUEST_TIMEOUT
+            )  # type: ignore[index]
             if res.status_code == 200:
                 self.on_connect()
                 return {"result": res.json()["result"]}
@@ -139,6 +150,7 @@ class ImageHandler:
             res: requests.Response = requests.post(
                 f"{self.url}/setconfig",
                 json={"f-number": f_number, "iso": iso, "shutterspeed": shutterspeed},
+                timeout=REQUEST_TIMEOUT,
             )  # type: ignore[index]
             if res.status_code == 200:
                 self.on_connect()
@@ -156,7 +168,9 @@ class ImageHandler:
 
     def get_img_count(self):
         try:
-            res: requests.Response = requests.get(f"{self.url}/last_image")  # type: ignore[index]
+            res: requests.Response = requests.get(
+                f"{self.url}/last_image", timeout=REQUEST_TIMEOUT
+            )  # type: ignore[index]
             if res.status_code == 200:
                 self.on_connect()
                 return res.json()["result"]
@@ -176,7 +190,7 @@ class ImageHandler:
             for i in range(self.img_count + 1, img_cnt + 1):
                 self.logger.info("[Image] Retreiving image %s", i)
                 try:
-                    img_data = requests.get(self.url + f"/image_data/{i}")
+                    img_data = requests.get(self.url + f"/image_data/{i}", timeout=REQUEST_TIMEOUT)
                     if img_data.status_code != 200:
                         self.logger.error(
                             "[Image] Unexpected status code, %s", img_data.status_code
@@ -190,7 +204,7 @@ class ImageHandler:
                         self.save_image(i, None, img_data.json())
                         self.logger.info("[Image] Image %s already exists; data retrieved", i)
                     else:
-                        img_res = requests.get(self.url + f"/image/{i}")
+                        img_res = requests.get(self.url + f"/image/{i}", timeout=REQUEST_TIMEOUT)
                         self.save_image(i, img_res.content, img_data.json())
                         self.logger.info("[Image] Image %s saved", i)
                 except CONNECTION_EXCEPTIONS as e:
@@ -0,0 +1,19 @@
+import functools
+import os
+from types import MappingProxyType
+from typing import Any, Mapping
+
+import orjson
+
+CONFIG_FILE: str = os.path.join(os.getcwd(), "config.json")
+
+
+@functools.lru_cache(maxsize=None)
+def load_config() -> Mapping[str, Any]:
+    """
+    Parse config.json once and return a read-only view of it.
+
+    Later calls return the cached result instead of re-reading the file.
+    """
+    with open(CONFIG_FILE, "rb") as file:
+        return MappingProxyType(orjson.loads(file.read()))
@@ -1,12 +1,12 @@
 import functools
 import inspect
 from functools import wraps
-from logging import Logger
+from logging import DEBUG, Logger
 from typing import Callable, Any
 
 from utils.errors import InvalidStateError
 
-log_exempt: tuple = ("update", "stats", "quick", "get_armed", "save_image")
+log_exempt: frozenset = frozenset(("update", "stats", "quick", "get_armed", "save_image"))
 
 
 def log(func: Callable, logger: Logger) -> Callable:
@@ -16,15 +16,16 @@ def log(func: Callable, logger: Logger) -> Callable:
         try:
             res = func(*args, **kwargs)
         finally:
-            class_ = get_class_that_defined_method(func)
-            if str(class_).count("'") >= 1:
-                class_ = str(class_).split("'")[1]
-            aargs = ", ".join(repr(x) for x in args[1:])
-            kkwargs = ", ".join(f"{k}={v}" for k, v in kwargs.items())
-            all_args = aargs + ", " + kkwargs if (aargs and kkwargs) else aargs + kkwargs
-            logger.debug(
-                "{:<60}".format(f"{class_}.{func.__name__}({all_args})") + f"  -->  {res}"
-            )
+            if logger.isEnabledFor(DEBUG):  # Skip building the call string if it won't be logged
+                class_ = get_class_that_defined_method(func)
+                if str(class_).count("'") >= 1:
+                    class_ = str(class_).split("'")[1]
+                aargs = ", ".join(repr(x) for x in args[1:])
+                kkwargs = ", ".join(f"{k}={v}" for k, v in kwargs.items())
+                all_args = aargs + ", " + kkwargs if (aargs and kkwargs) else aargs + kkwargs
+                logger.debug(
+                    "{:<60}".format(f"{class_}.{func.__name__}({all_args})") + f"  -->  {res}"
+                )
         return res
 
     return wrapper
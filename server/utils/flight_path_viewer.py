@@ -1,3 +1,4 @@
+import gzip
 from datetime import datetime
 from json import loads
 from fastkml import kml, geometry
@@ -56,7 +57,12 @@ def main():
     a.add_argument("out_file", nargs="?", default=None)
     args = a.parse_args()
     try:
-        in_file = open(args.in_file, "r") if args.in_file else stdin
+        if not args.in_file:
+            in_file = stdin
+        elif args.in_file.endswith(".gz"):  # Rotated logs are gzipped
+            in_file = gzip.open(args.in_file, "rt")
+        else:
+            in_file = open(args.in_file, "r")
     except FileNotFoundError:
         print("input file does not exist")
         exit(1)
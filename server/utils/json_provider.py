@@ -0,0 +1,40 @@
+from typing import Any
+
+import orjson
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+ORJSON_OPTIONS: int = orjson.OPT_NON_STR_KEYS
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider that uses orjson for jsonify(), dict responses, and request.json.
+
+    Types orjson doesn't know about fall back to Flask's default serializer. Responses are never
+    indented, even in debug mode.
+    """
+
+    sort_keys = False
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = ORJSON_OPTIONS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        # Same arguments as jsonify(): one value, several values (sent as a list), or kwargs
+        if args and kwargs:
+            raise TypeError("app.json.response() takes either args or kwargs, not both.")
+        obj = args[0] if len(args) == 1 else (args or kwargs or None)
+        # Hand orjson's bytes straight to the response instead of round-tripping through str
+        return self._app.response_class(
+            orjson.dumps(
+                obj, default=self.default, option=ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE
+            ),
+            mimetype=self.mimetype,
+        )
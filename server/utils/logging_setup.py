@@ -1,7 +1,15 @@
+import atexit
 import collections
+import gzip
 import logging
+import os
+import queue
+import shutil
+import threading
+import time
 from io import TextIOBase
-from typing import Any
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Mapping
 
 
 # https://stackoverflow.com/a/37952182/11317931
@@ -27,6 +35,103 @@ class FIFOIO(TextIOBase):
             size -= len(x)
 
 
+def gzip_rotator(source: str, dest: str) -> None:
+    with open(source, "rb") as log_file, gzip.open(dest, "wb") as gz_file:
+        shutil.copyfileobj(log_file, gz_file)
+    os.remove(source)
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that lets the stream buffer records instead of flushing after each one.
+
+    Records at WARNING or above are flushed immediately; everything else is written out by
+    flush_buffered_handlers() at least once every FLUSH_INTERVAL seconds. Rotated files are
+    gzipped (info.log.1.gz, info.log.2.gz, ...).
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 10,
+        buffer_size: int = 16384,
+        **kwargs,
+    ):
+        self.buffer_size = buffer_size
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, **kwargs)
+        self.namer = lambda name: name + ".gz"
+        self.rotator = gzip_rotator
+        BUFFERED_HANDLERS.append(self)
+
+    def _open(self):
+        # Track the file size here instead of seeking/stat-ing the (buffered) stream per record
+        self.bytes_written = (
+            os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+        )
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def should_roll_over(self, length: int) -> bool:
+        # Like RotatingFileHandler, never roll over without backups to roll over into
+        if self.maxBytes <= 0 or self.backupCount <= 0 or not self.bytes_written:
+            return False
+        return self.bytes_written + length >= self.maxBytes
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record) + self.terminator
+            # Counts characters, which is close enough to bytes for a rotation threshold
+            if self.should_roll_over(len(msg)):
+                self.doRollover()
+            self.stream.write(msg)
+            self.bytes_written += len(msg)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+
+    def start_session(self) -> None:
+        """
+        Move the previous run's records out of the way so each file holds a single session.
+
+        They become <name>.log.1.gz, or are discarded when there are no backups to keep.
+        """
+        self.acquire()
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            if not self.bytes_written:
+                return
+            if self.backupCount > 0:
+                self.doRollover()
+            else:
+                self.stream.truncate(0)
+                self.bytes_written = 0
+        finally:
+            self.release()
+
+
+FLUSH_INTERVAL: float = 1.0
+BUFFERED_HANDLERS: list[BufferedRotatingFileHandler] = []
+
+
+def flush_buffered_handlers() -> None:
+    while True:
+        time.sleep(FLUSH_INTERVAL)
+        for handler in BUFFERED_HANDLERS:
+            handler.flush()
+
+
 def log_level(self, message: Any, *args, **kwargs):
     # disable pylint checks for using `self._log`
     # pylint: disable=W0212
@@ -62,22 +167,44 @@ telem_formatter = logging.Formatter("%(asctime)s;%(message)s")
 # console_handler.setFormatter(formatter)
 # logger.addHandler(console_handler)
 
-file_handler: logging.FileHandler = logging.FileHandler("logs/info.log", mode="w")
+file_handler: BufferedRotatingFileHandler = BufferedRotatingFileHandler("logs/info.log")
 file_handler.setLevel(logging.INFO)
 file_handler.setFormatter(formatter)
-logger.addHandler(file_handler)
-autopilot.addHandler(file_handler)
 
-debug_file_handler: logging.FileHandler = logging.FileHandler("logs/debug.log", mode="w")
+debug_file_handler: BufferedRotatingFileHandler = BufferedRotatingFileHandler("logs/debug.log")
 debug_file_handler.setLevel(logging.DEBUG)
 debug_file_handler.setFormatter(formatter)
-logger.addHandler(debug_file_handler)
-autopilot.addHandler(debug_file_handler)
 
-telem_file_handler: logging.FileHandler = logging.FileHandler("logs/telem.log", mode="w")
+# File writes happen on the listener thread, so request handlers only enqueue records
+LOG_QUEUE: queue.SimpleQueue = queue.SimpleQueue()
+queue_handler: QueueHandler = QueueHandler(LOG_QUEUE)
+logger.addHandler(queue_handler)
+autopilot.addHandler(queue_handler)
+
+file_listener: QueueListener = QueueListener(
+    LOG_QUEUE, file_handler, debug_file_handler, respect_handler_level=True
+)
+file_listener.start()
+atexit.register(file_listener.stop)
+
+telem_file_handler: BufferedRotatingFileHandler = BufferedRotatingFileHandler("logs/telem.log")
 telem_file_handler.setLevel(logging.INFO)
 telem_file_handler.setFormatter(telem_formatter)
-telemetry.addHandler(telem_file_handler)
+
+# Separate queue so rollovers (and their gzip) never run on the UAV thread
+TELEM_QUEUE: queue.SimpleQueue = queue.SimpleQueue()
+telemetry.addHandler(QueueHandler(TELEM_QUEUE))
+
+telem_listener: QueueListener = QueueListener(
+    TELEM_QUEUE, telem_file_handler, respect_handler_level=True
+)
+telem_listener.start()
+atexit.register(telem_listener.stop)
+
+flush_thread: threading.Thread = threading.Thread(target=flush_buffered_handlers)
+flush_thread.name = "LogFlushThread"
+flush_thread.daemon = True
+flush_thread.start()
 
 ROLLING_LOGS: FIFOIO = FIFOIO(10)
 string_handler: logging.StreamHandler = logging.StreamHandler(ROLLING_LOGS)
@@ -86,4 +213,18 @@ string_handler.setFormatter(formatter)
 logger.addHandler(string_handler)
 autopilot.addHandler(string_handler)
 
-logger.info("STARTED LOGGING")
+
+def configure_logging(config: Mapping[str, Any]) -> None:
+    # DEBUG records and debug.log are opt-in, so they cost nothing unless enabled
+    debug_log = config.get("debug_log", False)
+    level = logging.DEBUG if debug_log else logging.INFO
+    logger.setLevel(level)
+    autopilot.setLevel(level)
+    # Above CRITICAL, the listener skips debug.log without formatting or writing anything
+    debug_file_handler.setLevel(logging.DEBUG if debug_log else logging.CRITICAL + 1)
+
+    for handler in BUFFERED_HANDLERS:
+        handler.backupCount = config.get("log_retention", handler.backupCount)
+        handler.start_session()
+
+    logger.info("STARTED LOGGING")
@@ -1,3 +1,4 @@
+import gzip
 import json
 import os
 
@@ -18,7 +19,10 @@ data = {
     "satellites": [float("inf"), 0, 0, 0],
 }
 
-with open(os.path.join(os.getcwd(), "logs", filename), "r", encoding="utf-8") as telem_file:
+# Rotated logs are gzipped (telem.log.1.gz, ...)
+open_log = gzip.open if filename.endswith(".gz") else open
+
+with open_log(os.path.join(os.getcwd(), "logs", filename), "rt", encoding="utf-8") as telem_file:
     count = 0
     for line in telem_file:
         count += 1